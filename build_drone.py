@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+FreeCAD script to generate the fishing drone at a chosen level of detail
+simple builds the ROV-style model of create_advanced_hull.py, detailed the
+production model of create_detailed_drone.py
+Building both in one run shares the cached hull and OCC state between them
+
+Usage: python3 build_drone.py [simple] [detailed]
+"""
+
+import sys
+sys.path.append('/usr/lib/freecad/lib')
+
+from typing import Literal
+
+import create_advanced_hull
+import create_detailed_drone
+
+# Model builder for each detail level
+BUILDERS = {
+    "simple": create_advanced_hull.build,
+    "detailed": create_detailed_drone.build,
+}
+
+USAGE = "Usage: python3 build_drone.py [simple] [detailed]"
+
+def build(detail_level: Literal["simple", "detailed"]) -> None:
+    """Build, save and export the drone model for the given detail level"""
+    BUILDERS[detail_level]()
+
+if __name__ == "__main__":
+    detail_levels = sys.argv[1:] or list(BUILDERS)
+
+    # Check every level before building, so a typo never leaves a partial run
+    unknown = [level for level in detail_levels if level not in BUILDERS]
+    if unknown:
+        print(f"Unknown detail level: {', '.join(unknown)}", file=sys.stderr)
+        print(USAGE, file=sys.stderr)
+        sys.exit(2)
+
+    for detail_level in detail_levels:
+        build(detail_level)
@@ -9,32 +9,28 @@ sys.path.append('/usr/lib/freecad/lib')
 
 import FreeCAD
 import Part
-import math
+import numpy as np
 
-# Create a new document
-doc = FreeCAD.newDocument("DetailedFishingDrone")
+from drone_common import (
+    HALF_H, HALF_L, HALF_W, ROT_IDENTITY, ROT_X_POS90, ROT_Y_NEG90, ROT_Y_POS90,
+    THRUSTER_TABLE, R, V,
+    main_body_height, main_body_length, main_body_width, propeller_diameter,
+    thruster_length, wall_thickness,
+    add_shape, box, build_hollow_hull, build_in_processes, coarse_tessellation,
+    cone, cut, cylinder, evaluate, export_step, fuse, new_build_document, ring,
+    save_document, sphere,
+)
+
+# Active document, created by build()
+doc = None
 
 # ============================================================================
 # DESIGN PARAMETERS
 # ============================================================================
 
-# Main body
-main_body_length = 350  # mm
-main_body_width = 280   # mm
-main_body_height = 180  # mm
-wall_thickness = 4      # mm
-
 # Thruster specifications
-thruster_diameter = 60  # mm
-thruster_length = 80    # mm
 thruster_motor_diameter = 42  # mm
-propeller_diameter = 70  # mm
-num_thrusters = 6
-
-# Battery specifications
-battery_width = 150
-battery_height = 50
-battery_depth = 100
+propeller_blades = 3
 
 # Electronics
 pcb_width = 120
@@ -45,6 +41,21 @@ pcb_thickness = 1.6
 connector_diameter = 12
 connector_length = 30
 
+# Positions of repeated components as (N, 3) arrays of x, y, z; builders
+# translate one prototype to each row
+# Battery cells on a 4x2 grid (4S2P)
+CELL_POS = np.array(
+    [[-40 + i*25, -15 + j*30, -HALF_H + 15] for i in range(4) for j in range(2)]
+)
+# PCB standoffs at the four board corners
+STANDOFF_POS = np.array(
+    [[sx * (pcb_length/2 - 5), sy * (pcb_width/2 - 5), 2] for sx in (-1, 1) for sy in (-1, 1)]
+)
+# ESCs (one per thruster) on a 3x2 grid above the PCB
+ESC_POS = np.array(
+    [[-50 + col*40, -45 + row*50, 10 + pcb_thickness + 5] for row in range(2) for col in range(3)]
+)
+
 # ============================================================================
 # MAIN BODY
 # ============================================================================
@@ -53,79 +64,11 @@ def create_main_body():
     """Create detailed streamlined main body with mounting features"""
     print("Creating detailed main body...")
 
-    # Center section
-    center_body = doc.addObject("Part::Box", "CenterBody")
-    center_body.Length = main_body_length - 100
-    center_body.Width = main_body_width
-    center_body.Height = main_body_height
-    center_body.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-(main_body_length - 100)/2, -main_body_width/2, -main_body_height/2),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    # Rounded nose
-    nose = doc.addObject("Part::Sphere", "Nose")
-    nose.Radius = main_body_height / 2
-    nose.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-(main_body_length - 100)/2, 0, 0),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    # Rounded tail
-    tail = doc.addObject("Part::Sphere", "Tail")
-    tail.Radius = main_body_height / 2
-    tail.Placement = FreeCAD.Placement(
-        FreeCAD.Vector((main_body_length - 100)/2, 0, 0),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    doc.recompute()
-
-    # Fuse outer shell
-    body_outer = doc.addObject("Part::MultiFuse", "BodyOuter")
-    body_outer.Shapes = [center_body, nose, tail]
-    doc.recompute()
-
-    # Create hollow interior
-    center_inner = doc.addObject("Part::Box", "CenterInner")
-    center_inner.Length = main_body_length - 100 - 2*wall_thickness
-    center_inner.Width = main_body_width - 2*wall_thickness
-    center_inner.Height = main_body_height - 2*wall_thickness
-    center_inner.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(
-            -(main_body_length - 100)/2 + wall_thickness,
-            -main_body_width/2 + wall_thickness,
-            -main_body_height/2 + wall_thickness
-        ),
-        FreeCAD.Rotation(0, 0, 0)
+    # Hollow shell: center section with rounded nose and tail
+    hollow_body = build_hollow_hull(
+        main_body_length, main_body_width, main_body_height, wall_thickness
     )
 
-    nose_inner = doc.addObject("Part::Sphere", "NoseInner")
-    nose_inner.Radius = main_body_height / 2 - wall_thickness
-    nose_inner.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-(main_body_length - 100)/2 + wall_thickness/2, 0, 0),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    tail_inner = doc.addObject("Part::Sphere", "TailInner")
-    tail_inner.Radius = main_body_height / 2 - wall_thickness
-    tail_inner.Placement = FreeCAD.Placement(
-        FreeCAD.Vector((main_body_length - 100)/2 - wall_thickness/2, 0, 0),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    doc.recompute()
-
-    body_inner = doc.addObject("Part::MultiFuse", "BodyInner")
-    body_inner.Shapes = [center_inner, nose_inner, tail_inner]
-    doc.recompute()
-
-    # Make hollow
-    hollow_body = doc.addObject("Part::Cut", "HollowBody")
-    hollow_body.Base = body_outer
-    hollow_body.Tool = body_inner
-    doc.recompute()
-
     # Add internal ribs for structural strength
     ribs = create_internal_ribs()
 
@@ -133,231 +76,135 @@ def create_main_body():
 
 def create_internal_ribs():
     """Create internal structural ribs"""
-    ribs = []
     rib_thickness = 2
     rib_spacing = 60
+    rib_width = main_body_width - 2*wall_thickness - 10
 
+    # The 3 vertical and 3 horizontal ribs are translated copies of one
+    # prototype each
+    vertical_rib = Part.makeBox(rib_thickness, rib_width, main_body_height - 2*wall_thickness - 10)
+    horizontal_rib = Part.makeBox(rib_thickness, rib_width, rib_thickness)
+
+    ribs = []
     for i in range(-1, 2):  # 3 ribs
-        x_pos = i * rib_spacing
-
-        # Vertical rib
-        rib = doc.addObject("Part::Box", f"Rib_V_{i}")
-        rib.Length = rib_thickness
-        rib.Width = main_body_width - 2*wall_thickness - 10
-        rib.Height = main_body_height - 2*wall_thickness - 10
-        rib.Placement = FreeCAD.Placement(
-            FreeCAD.Vector(
-                x_pos - rib_thickness/2,
-                -main_body_width/2 + wall_thickness + 5,
-                -main_body_height/2 + wall_thickness + 5
-            ),
-            FreeCAD.Rotation(0, 0, 0)
-        )
-        ribs.append(rib)
-
-        # Horizontal rib
-        rib_h = doc.addObject("Part::Box", f"Rib_H_{i}")
-        rib_h.Length = rib_thickness
-        rib_h.Width = main_body_width - 2*wall_thickness - 10
-        rib_h.Height = rib_thickness
-        rib_h.Placement = FreeCAD.Placement(
-            FreeCAD.Vector(
-                x_pos - rib_thickness/2,
-                -main_body_width/2 + wall_thickness + 5,
-                0
-            ),
-            FreeCAD.Rotation(0, 0, 0)
-        )
-        ribs.append(rib_h)
+        x_pos = i * rib_spacing - rib_thickness/2
+        y_pos = -HALF_W + wall_thickness + 5
 
-    doc.recompute()
-    return ribs
+        ribs.append(vertical_rib.translated(V(x_pos, y_pos, -HALF_H + wall_thickness + 5)))
+        ribs.append(horizontal_rib.translated(V(x_pos, y_pos, 0)))
+
+    return Part.Compound(ribs)
 
 # ============================================================================
 # DETAILED THRUSTERS
 # ============================================================================
 
-def create_detailed_thruster(position, rotation, name):
-    """Create detailed thruster with motor, propeller, and guard"""
+# Propeller blades (evenly spaced) and guard struts (4, 90 degrees apart)
+BLADE_ANGLES = np.arange(propeller_blades) * (360.0 / propeller_blades)
+BLADE_COS = np.cos(np.radians(BLADE_ANGLES))
+BLADE_SIN = np.sin(np.radians(BLADE_ANGLES))
+STRUT_ANGLES = np.array([0.0, 90.0, 180.0, 270.0])
+
+# Placements of the axis-aligned thruster parts relative to the thruster
+# position; each thruster only translates these instead of rebuilding them
+BRACKET_PLACEMENT = FreeCAD.Placement(
+    V(
+        -(thruster_motor_diameter + 10)/2,
+        -(thruster_motor_diameter + 10)/2,
+        thruster_length/2
+    ),
+    ROT_IDENTITY
+)
+BLADE_PLACEMENTS = [
+    FreeCAD.Placement(
+        V(cos * propeller_diameter/4, sin * propeller_diameter/4, thruster_length),
+        R(0, 0, angle)
+    )
+    for angle, cos, sin in zip(BLADE_ANGLES, BLADE_COS, BLADE_SIN)
+]
+STRUT_PLACEMENTS = [
+    FreeCAD.Placement(V(0, 0, thruster_length + 6), R(0, 0, angle))
+    for angle in STRUT_ANGLES
+]
+ARM_PLACEMENTS = [
+    FreeCAD.Placement(V(0, offset, thruster_length/2), ROT_IDENTITY)
+    for offset in (15, -15)
+]
+
+def create_detailed_thruster(position, rotation):
+    """Describe a detailed thruster (motor, propeller, guard) as a CSG tree"""
 
     parts = []
+    origin = FreeCAD.Placement(position, ROT_IDENTITY)
 
     # Motor housing
-    motor_housing = doc.addObject("Part::Cylinder", f"MotorHousing_{name}")
-    motor_housing.Radius = thruster_motor_diameter / 2
-    motor_housing.Height = thruster_length
-    motor_housing.Placement = FreeCAD.Placement(position, rotation)
-    parts.append(motor_housing)
-
-    doc.recompute()
+    parts.append(cylinder(
+        thruster_motor_diameter / 2, thruster_length,
+        FreeCAD.Placement(position, rotation)
+    ))
 
     # Motor front cap
-    cap = doc.addObject("Part::Cylinder", f"MotorCap_{name}")
-    cap.Radius = thruster_motor_diameter / 2 + 2
-    cap.Height = 5
-    cap_pos = FreeCAD.Vector(position.x, position.y, position.z - 5)
-    cap.Placement = FreeCAD.Placement(cap_pos, rotation)
-    parts.append(cap)
+    cap_pos = V(position.x, position.y, position.z - 5)
+    parts.append(cylinder(
+        thruster_motor_diameter / 2 + 2, 5,
+        FreeCAD.Placement(cap_pos, rotation)
+    ))
 
     # Motor mounting bracket
-    bracket = doc.addObject("Part::Box", f"MotorBracket_{name}")
-    bracket.Length = thruster_motor_diameter + 10
-    bracket.Width = thruster_motor_diameter + 10
-    bracket.Height = 3
-    bracket.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(
-            position.x - (thruster_motor_diameter + 10)/2,
-            position.y - (thruster_motor_diameter + 10)/2,
-            position.z + thruster_length/2
-        ),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-    parts.append(bracket)
-
-    # Propeller blades (simplified - 3 blades)
-    for i in range(3):
-        angle = i * 120
-        blade = doc.addObject("Part::Box", f"PropBlade_{name}_{i}")
-        blade.Length = propeller_diameter / 2
-        blade.Width = 8
-        blade.Height = 2
-
-        rad = math.radians(angle)
-        blade_x = position.x + math.cos(rad) * propeller_diameter/4
-        blade_y = position.y + math.sin(rad) * propeller_diameter/4
-
-        blade.Placement = FreeCAD.Placement(
-            FreeCAD.Vector(blade_x, blade_y, position.z + thruster_length),
-            FreeCAD.Rotation(0, 0, angle)
-        )
-        parts.append(blade)
-
-    # Propeller hub
-    hub = doc.addObject("Part::Cylinder", f"PropHub_{name}")
-    hub.Radius = 8
-    hub.Height = 10
-    hub.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(position.x, position.y, position.z + thruster_length),
-        rotation
-    )
-    parts.append(hub)
-
-    # Propeller guard - outer ring
-    guard_outer = doc.addObject("Part::Cylinder", f"GuardOuter_{name}")
-    guard_outer.Radius = propeller_diameter / 2 + 10
-    guard_outer.Height = 4
-    guard_outer.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(position.x, position.y, position.z + thruster_length + 5),
-        rotation
-    )
-
-    guard_inner = doc.addObject("Part::Cylinder", f"GuardInner_{name}")
-    guard_inner.Radius = propeller_diameter / 2 + 5
-    guard_inner.Height = 6
-    guard_inner.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(position.x, position.y, position.z + thruster_length + 4),
-        rotation
-    )
+    parts.append(box(
+        thruster_motor_diameter + 10, thruster_motor_diameter + 10, 3,
+        origin.multiply(BRACKET_PLACEMENT)
+    ))
 
-    doc.recompute()
+    # Propeller blades (simplified - one box per blade)
+    for blade_placement in BLADE_PLACEMENTS:
+        parts.append(box(propeller_diameter / 2, 8, 2, origin.multiply(blade_placement)))
 
-    guard_ring = doc.addObject("Part::Cut", f"GuardRing_{name}")
-    guard_ring.Base = guard_outer
-    guard_ring.Tool = guard_inner
-    doc.recompute()
+    # Propeller hub
+    parts.append(cylinder(
+        8, 10,
+        FreeCAD.Placement(
+            V(position.x, position.y, position.z + thruster_length),
+            rotation
+        )
+    ))
 
-    parts.append(guard_ring)
+    # Propeller guard ring
+    parts.append(ring(
+        propeller_diameter / 2 + 10, propeller_diameter / 2 + 5, 4,
+        FreeCAD.Placement(
+            V(position.x, position.y, position.z + thruster_length + 5),
+            rotation
+        )
+    ))
 
     # Guard support struts (4 struts)
-    for i in range(4):
-        angle = i * 90
-        strut = doc.addObject("Part::Box", f"GuardStrut_{name}_{i}")
-        strut.Length = propeller_diameter / 2 + 8
-        strut.Width = 3
-        strut.Height = 2
-
-        rad = math.radians(angle)
-        strut_x = position.x
-        strut_y = position.y
-
-        strut.Placement = FreeCAD.Placement(
-            FreeCAD.Vector(strut_x, strut_y, position.z + thruster_length + 6),
-            FreeCAD.Rotation(0, 0, angle)
-        )
-        parts.append(strut)
+    for strut_placement in STRUT_PLACEMENTS:
+        parts.append(box(propeller_diameter / 2 + 8, 3, 2, origin.multiply(strut_placement)))
 
     # Mounting arms to main body
-    for i in range(2):
-        arm = doc.addObject("Part::Box", f"MountArm_{name}_{i}")
-        arm.Length = 40
-        arm.Width = 6
-        arm.Height = 6
-
-        offset = 15 if i == 0 else -15
-        arm.Placement = FreeCAD.Placement(
-            FreeCAD.Vector(position.x, position.y + offset, position.z + thruster_length/2),
-            FreeCAD.Rotation(0, 0, 0)
-        )
-        parts.append(arm)
-
-    doc.recompute()
+    for arm_placement in ARM_PLACEMENTS:
+        parts.append(box(40, 6, 6, origin.multiply(arm_placement)))
 
-    # Fuse all thruster parts
-    thruster_assembly = doc.addObject("Part::MultiFuse", f"Thruster_{name}")
-    thruster_assembly.Shapes = parts
-    doc.recompute()
+    # All thruster parts are fused into one solid when evaluated
+    return fuse(*parts)
 
-    return thruster_assembly
+def build_thruster_brep(row):
+    """Build one thruster from a THRUSTER_TABLE row and return it as BRep text"""
+    thruster = create_detailed_thruster(
+        V(*row[:3]),
+        R(tuple(row[3:6]), row[6])
+    )
+    return evaluate(thruster).exportBrepToString()
 
 def create_thruster_layout():
     """Create 6-thruster configuration"""
     print("Creating detailed thruster layout...")
 
-    thrusters = []
+    # The thrusters share no geometry, so each one is built in its own process
+    shapes = build_in_processes(build_thruster_brep, THRUSTER_TABLE, max_workers=len(THRUSTER_TABLE))
 
-    # Front-left horizontal
-    thrusters.append(create_detailed_thruster(
-        FreeCAD.Vector(-main_body_length/2 - 40, main_body_width/2 - 40, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90),
-        "FL"
-    ))
-
-    # Front-right horizontal
-    thrusters.append(create_detailed_thruster(
-        FreeCAD.Vector(-main_body_length/2 - 40, -main_body_width/2 + 40, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90),
-        "FR"
-    ))
-
-    # Rear-left horizontal
-    thrusters.append(create_detailed_thruster(
-        FreeCAD.Vector(main_body_length/2 + 40, main_body_width/2 - 40, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), -90),
-        "RL"
-    ))
-
-    # Rear-right horizontal
-    thrusters.append(create_detailed_thruster(
-        FreeCAD.Vector(main_body_length/2 + 40, -main_body_width/2 + 40, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), -90),
-        "RR"
-    ))
-
-    # Top vertical
-    thrusters.append(create_detailed_thruster(
-        FreeCAD.Vector(0, 60, main_body_height/2 + 10),
-        FreeCAD.Rotation(0, 0, 0),
-        "TV"
-    ))
-
-    # Bottom vertical
-    thrusters.append(create_detailed_thruster(
-        FreeCAD.Vector(0, -60, -main_body_height/2 - 10),
-        FreeCAD.Rotation(0, 0, 0),
-        "BV"
-    ))
-
-    return thrusters
+    return Part.Compound(shapes)
 
 # ============================================================================
 # WATERPROOF CONNECTORS & CABLE GLANDS
@@ -367,62 +214,49 @@ def create_cable_glands():
     """Create waterproof cable gland penetrations"""
     print("Creating waterproof cable glands...")
 
-    glands = []
-
     # Main power connector (rear, top)
-    power_gland = doc.addObject("Part::Cylinder", "PowerGland")
-    power_gland.Radius = connector_diameter / 2
-    power_gland.Height = connector_length
-    power_gland.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(main_body_length/2 - 20, 0, main_body_height/2 - 20),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
+    power_placement = FreeCAD.Placement(
+        V(HALF_L - 20, 0, HALF_H - 20),
+        ROT_Y_POS90
     )
-    glands.append(power_gland)
 
     # Communication connector (rear, side)
-    comm_gland = doc.addObject("Part::Cylinder", "CommGland")
-    comm_gland.Radius = connector_diameter / 2
-    comm_gland.Height = connector_length
-    comm_gland.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(main_body_length/2 - 20, main_body_width/2 - 20, 20),
-        FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 90)
+    comm_placement = FreeCAD.Placement(
+        V(HALF_L - 20, HALF_W - 20, 20),
+        ROT_X_POS90
     )
-    glands.append(comm_gland)
+
+    glands = [
+        cylinder(connector_diameter / 2, connector_length, power_placement),
+        cylinder(connector_diameter / 2, connector_length, comm_placement),
+    ]
 
     # Thruster cables (6 smaller glands)
     thruster_positions = [
-        (-main_body_length/2 + 30, main_body_width/2 - 30, 30),
-        (-main_body_length/2 + 30, -main_body_width/2 + 30, 30),
-        (main_body_length/2 - 30, main_body_width/2 - 30, 30),
-        (main_body_length/2 - 30, -main_body_width/2 + 30, 30),
-        (20, main_body_width/2 - 20, main_body_height/2 - 10),
-        (20, -main_body_width/2 + 20, -main_body_height/2 + 10),
+        (-HALF_L + 30, HALF_W - 30, 30),
+        (-HALF_L + 30, -HALF_W + 30, 30),
+        (HALF_L - 30, HALF_W - 30, 30),
+        (HALF_L - 30, -HALF_W + 30, 30),
+        (20, HALF_W - 20, HALF_H - 10),
+        (20, -HALF_W + 20, -HALF_H + 10),
     ]
 
-    for i, (x, y, z) in enumerate(thruster_positions):
-        gland = doc.addObject("Part::Cylinder", f"ThrusterGland_{i}")
-        gland.Radius = 6
-        gland.Height = 20
-        gland.Placement = FreeCAD.Placement(
-            FreeCAD.Vector(x, y, z),
-            FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 90)
-        )
-        glands.append(gland)
-
-    doc.recompute()
-
-    # Connector housings (bulkhead connectors)
-    housings = []
-    for i, gland in enumerate(glands[:2]):  # Main connectors only
-        housing = doc.addObject("Part::Cylinder", f"ConnectorHousing_{i}")
-        housing.Radius = connector_diameter / 2 + 3
-        housing.Height = 15
-        housing.Placement = gland.Placement
-        housings.append(housing)
+    for x, y, z in thruster_positions:
+        glands.append(cylinder(
+            6, 20,
+            FreeCAD.Placement(
+                V(x, y, z),
+                ROT_X_POS90
+            )
+        ))
 
-    doc.recompute()
+    # Connector housings (bulkhead connectors) - main connectors only
+    housings = [
+        cylinder(connector_diameter / 2 + 3, 15, placement)
+        for placement in (power_placement, comm_placement)
+    ]
 
-    return glands, housings
+    return Part.Compound(glands + housings)
 
 # ============================================================================
 # BATTERY SYSTEM
@@ -432,61 +266,43 @@ def create_battery_system():
     """Create detailed battery pack and mounting"""
     print("Creating battery system...")
 
-    # Battery cells (4S configuration - 4 cells)
-    cells = []
+    # Battery cells (4S configuration - 4 cells), translated copies of one
+    # prototype cell grouped into their own sub-compound
     cell_diameter = 18
     cell_height = 65
 
-    for i in range(4):
-        for j in range(2):
-            cell = doc.addObject("Part::Cylinder", f"BatteryCell_{i}_{j}")
-            cell.Radius = cell_diameter / 2
-            cell.Height = cell_height
-            cell.Placement = FreeCAD.Placement(
-                FreeCAD.Vector(
-                    -40 + i * 25,
-                    -15 + j * 30,
-                    -main_body_height/2 + 15
-                ),
-                FreeCAD.Rotation(0, 0, 0)
-            )
-            cells.append(cell)
-
-    doc.recompute()
+    cell = Part.makeCylinder(cell_diameter / 2, cell_height)
+    cells = Part.Compound([cell.translated(V(x, y, z)) for x, y, z in CELL_POS])
+    parts = [cells]
 
     # Battery holder tray
-    tray = doc.addObject("Part::Box", "BatteryTray")
-    tray.Length = 120
-    tray.Width = 80
-    tray.Height = 3
-    tray.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-60, -40, -main_body_height/2 + 12),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    parts.append(box(
+        120, 80, 3,
+        FreeCAD.Placement(
+            V(-60, -40, -HALF_H + 12),
+            ROT_IDENTITY
+        )
+    ))
 
     # Battery protection cover
-    cover = doc.addObject("Part::Box", "BatteryCover")
-    cover.Length = 125
-    cover.Width = 85
-    cover.Height = 70
-    cover.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-62.5, -42.5, -main_body_height/2 + 15),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    parts.append(box(
+        125, 85, 70,
+        FreeCAD.Placement(
+            V(-62.5, -42.5, -HALF_H + 15),
+            ROT_IDENTITY
+        )
+    ))
 
     # BMS (Battery Management System) board
-    bms = doc.addObject("Part::Box", "BMS")
-    bms.Length = 40
-    bms.Width = 30
-    bms.Height = 2
-    bms.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-20, -15, -main_body_height/2 + 85),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    doc.recompute()
+    parts.append(box(
+        40, 30, 2,
+        FreeCAD.Placement(
+            V(-20, -15, -HALF_H + 85),
+            ROT_IDENTITY
+        )
+    ))
 
-    return cells, tray, cover, bms
+    return Part.Compound(parts)
 
 # ============================================================================
 # ELECTRONICS & PCB
@@ -497,88 +313,39 @@ def create_electronics():
     print("Creating electronics...")
 
     # Main control PCB
-    main_pcb = doc.addObject("Part::Box", "MainPCB")
-    main_pcb.Length = pcb_length
-    main_pcb.Width = pcb_width
-    main_pcb.Height = pcb_thickness
-    main_pcb.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-pcb_length/2, -pcb_width/2, 10),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    main_pcb = box(pcb_length, pcb_width, pcb_thickness, FreeCAD.Placement(
+        V(-pcb_length/2, -pcb_width/2, 10),
+        ROT_IDENTITY
+    ))
 
     # PCB standoffs (4 corners)
-    standoffs = []
-    standoff_positions = [
-        (-pcb_length/2 + 5, -pcb_width/2 + 5),
-        (-pcb_length/2 + 5, pcb_width/2 - 5),
-        (pcb_length/2 - 5, -pcb_width/2 + 5),
-        (pcb_length/2 - 5, pcb_width/2 - 5),
-    ]
-
-    for i, (x, y) in enumerate(standoff_positions):
-        standoff = doc.addObject("Part::Cylinder", f"Standoff_{i}")
-        standoff.Radius = 3
-        standoff.Height = 8
-        standoff.Placement = FreeCAD.Placement(
-            FreeCAD.Vector(x, y, 2),
-            FreeCAD.Rotation(0, 0, 0)
-        )
-        standoffs.append(standoff)
+    standoff = Part.makeCylinder(3, 8)
+    standoffs = [standoff.translated(V(x, y, z)) for x, y, z in STANDOFF_POS]
 
     # Microcontroller (simplified)
-    mcu = doc.addObject("Part::Box", "Microcontroller")
-    mcu.Length = 30
-    mcu.Width = 30
-    mcu.Height = 3
-    mcu.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-15, -15, 10 + pcb_thickness),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    mcu = box(30, 30, 3, FreeCAD.Placement(
+        V(-15, -15, 10 + pcb_thickness),
+        ROT_IDENTITY
+    ))
 
-    # ESCs (Electronic Speed Controllers) - 6 units
-    escs = []
-    for i in range(6):
-        esc = doc.addObject("Part::Box", f"ESC_{i}")
-        esc.Length = 35
-        esc.Width = 18
-        esc.Height = 8
-
-        row = i // 3
-        col = i % 3
-
-        esc.Placement = FreeCAD.Placement(
-            FreeCAD.Vector(
-                -50 + col * 40,
-                -45 + row * 50,
-                10 + pcb_thickness + 5
-            ),
-            FreeCAD.Rotation(0, 0, 0)
-        )
-        escs.append(esc)
+    # ESCs (Electronic Speed Controllers) - 6 units on a 3x2 grid
+    esc = Part.makeBox(35, 18, 8)
+    escs = [esc.translated(V(x, y, z)) for x, y, z in ESC_POS]
 
     # IMU sensor
-    imu = doc.addObject("Part::Box", "IMU")
-    imu.Length = 15
-    imu.Width = 15
-    imu.Height = 3
-    imu.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(25, -7.5, 10 + pcb_thickness),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    imu = box(15, 15, 3, FreeCAD.Placement(
+        V(25, -7.5, 10 + pcb_thickness),
+        ROT_IDENTITY
+    ))
 
     # Voltage regulator
-    regulator = doc.addObject("Part::Box", "VoltageRegulator")
-    regulator.Length = 25
-    regulator.Width = 15
-    regulator.Height = 5
-    regulator.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(50, -7.5, 10 + pcb_thickness),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    doc.recompute()
+    regulator = box(25, 15, 5, FreeCAD.Placement(
+        V(50, -7.5, 10 + pcb_thickness),
+        ROT_IDENTITY
+    ))
 
-    return [main_pcb] + standoffs + [mcu, imu, regulator] + escs
+    parts = [main_pcb] + standoffs + [mcu, imu, regulator] + escs
+    return Part.Compound(parts)
 
 # ============================================================================
 # ANTENNA & COMMUNICATION
@@ -589,41 +356,24 @@ def create_antenna():
     print("Creating antenna...")
 
     # Antenna mast
-    mast = doc.addObject("Part::Cylinder", "AntennaMast")
-    mast.Radius = 3
-    mast.Height = 80
-    mast.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(main_body_length/2 - 40, 0, main_body_height/2),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    mast = cylinder(3, 80, FreeCAD.Placement(
+        V(HALF_L - 40, 0, HALF_H),
+        ROT_IDENTITY
+    ))
 
     # Antenna tip
-    tip = doc.addObject("Part::Cone", "AntennaTip")
-    tip.Radius1 = 3
-    tip.Radius2 = 0
-    tip.Height = 15
-    tip.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(main_body_length/2 - 40, 0, main_body_height/2 + 80),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    tip = cone(3, 0, 15, FreeCAD.Placement(
+        V(HALF_L - 40, 0, HALF_H + 80),
+        ROT_IDENTITY
+    ))
 
     # Antenna base mount
-    base = doc.addObject("Part::Cylinder", "AntennaBase")
-    base.Radius = 8
-    base.Height = 10
-    base.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(main_body_length/2 - 40, 0, main_body_height/2 - 5),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    doc.recompute()
-
-    antenna_parts = [mast, tip, base]
-    antenna_assembly = doc.addObject("Part::MultiFuse", "AntennaAssembly")
-    antenna_assembly.Shapes = antenna_parts
-    doc.recompute()
+    base = cylinder(8, 10, FreeCAD.Placement(
+        V(HALF_L - 40, 0, HALF_H - 5),
+        ROT_IDENTITY
+    ))
 
-    return antenna_assembly
+    return Part.Compound([mast, tip, base])
 
 # ============================================================================
 # FISHING LINE RELEASE MECHANISM
@@ -634,94 +384,56 @@ def create_fishing_mechanism():
     print("Creating fishing line release mechanism...")
 
     # Servo motor housing
-    servo_box = doc.addObject("Part::Box", "ServoHousing")
-    servo_box.Length = 40
-    servo_box.Width = 20
-    servo_box.Height = 35
-    servo_box.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 50, -10, -17.5),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    servo_box = box(40, 20, 35, FreeCAD.Placement(
+        V(-HALF_L - 50, -10, -17.5),
+        ROT_IDENTITY
+    ))
 
     # Servo horn (actuator arm)
-    servo_horn = doc.addObject("Part::Box", "ServoHorn")
-    servo_horn.Length = 25
-    servo_horn.Width = 5
-    servo_horn.Height = 2
-    servo_horn.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 50, -2.5, 18),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    servo_horn = box(25, 5, 2, FreeCAD.Placement(
+        V(-HALF_L - 50, -2.5, 18),
+        ROT_IDENTITY
+    ))
 
     # Release gate
-    gate = doc.addObject("Part::Box", "ReleaseGate")
-    gate.Length = 30
-    gate.Width = 3
-    gate.Height = 40
-    gate.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 70, -1.5, -20),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    gate = box(30, 3, 40, FreeCAD.Placement(
+        V(-HALF_L - 70, -1.5, -20),
+        ROT_IDENTITY
+    ))
 
     # Line spool holder
-    spool_holder = doc.addObject("Part::Cylinder", "SpoolHolder")
-    spool_holder.Radius = 25
-    spool_holder.Height = 50
-    spool_holder.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 80, 0, -10),
-        FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 90)
-    )
+    spool_holder = cylinder(25, 50, FreeCAD.Placement(
+        V(-HALF_L - 80, 0, -10),
+        ROT_X_POS90
+    ))
 
     # Line spool (with line)
-    spool = doc.addObject("Part::Cylinder", "LineSpool")
-    spool.Radius = 20
-    spool.Height = 40
-    spool.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 80, 0, -10),
-        FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 90)
-    )
+    spool = cylinder(20, 40, FreeCAD.Placement(
+        V(-HALF_L - 80, 0, -10),
+        ROT_X_POS90
+    ))
 
     # Line guide tube
-    guide_outer = doc.addObject("Part::Cylinder", "LineGuideOuter")
-    guide_outer.Radius = 5
-    guide_outer.Height = 40
-    guide_outer.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 100, 0, -10),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-    )
-
-    guide_inner = doc.addObject("Part::Cylinder", "LineGuideInner")
-    guide_inner.Radius = 3
-    guide_inner.Height = 45
-    guide_inner.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 102, 0, -10),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-    )
-
-    doc.recompute()
-
-    line_guide = doc.addObject("Part::Cut", "LineGuide")
-    line_guide.Base = guide_outer
-    line_guide.Tool = guide_inner
-    doc.recompute()
-
-    # Hook attachment point
-    hook_ring = doc.addObject("Part::Torus", "HookRing")
-    hook_ring.Radius1 = 8
-    hook_ring.Radius2 = 2
-    hook_ring.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 120, 0, -10),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-    )
+    guide_outer = cylinder(5, 40, FreeCAD.Placement(
+        V(-HALF_L - 100, 0, -10),
+        ROT_Y_POS90
+    ))
+    guide_inner = cylinder(3, 45, FreeCAD.Placement(
+        V(-HALF_L - 102, 0, -10),
+        ROT_Y_POS90
+    ))
+    line_guide = evaluate(cut(guide_outer, guide_inner))
 
-    doc.recompute()
+    # Hook attachment point: a flat ring with the footprint of an 8mm torus
+    # of 2mm section, centered on the same point along the X axis
+    hook_ring = ring(10, 6, 4, FreeCAD.Placement(
+        V(-HALF_L - 122, 0, -10),
+        ROT_Y_POS90
+    ))
 
     fishing_parts = [servo_box, servo_horn, gate, spool_holder, spool, line_guide, hook_ring]
-    fishing_assembly = doc.addObject("Part::MultiFuse", "FishingMechanism")
-    fishing_assembly.Shapes = fishing_parts
-    doc.recompute()
 
-    return fishing_assembly
+    return Part.Compound(fishing_parts)
 
 # ============================================================================
 # CAMERA & LIGHTS
@@ -732,75 +444,32 @@ def create_camera_system():
     print("Creating camera system...")
 
     # Camera housing
-    camera_housing = doc.addObject("Part::Sphere", "CameraHousing")
-    camera_housing.Radius = 20
-    camera_housing.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/3, 0, -main_body_height/2 - 35),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    camera_housing = sphere(20, V(-main_body_length/3, 0, -HALF_H - 35))
 
     # Camera lens
-    lens = doc.addObject("Part::Cylinder", "CameraLens")
-    lens.Radius = 8
-    lens.Height = 10
-    lens.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/3, 0, -main_body_height/2 - 50),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    lens = cylinder(8, 10, FreeCAD.Placement(
+        V(-main_body_length/3, 0, -HALF_H - 50),
+        ROT_IDENTITY
+    ))
 
     # Gimbal mount (2-axis)
-    gimbal_yaw = doc.addObject("Part::Cylinder", "GimbalYaw")
-    gimbal_yaw.Radius = 4
-    gimbal_yaw.Height = 30
-    gimbal_yaw.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/3, 0, -main_body_height/2 - 20),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    # LED lights (2x high-power)
-    led_left = doc.addObject("Part::Cylinder", "LED_Left")
-    led_left.Radius = 10
-    led_left.Height = 20
-    led_left.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 + 30, main_body_width/2 - 30, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-    )
-
-    led_right = doc.addObject("Part::Cylinder", "LED_Right")
-    led_right.Radius = 10
-    led_right.Height = 20
-    led_right.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 + 30, -main_body_width/2 + 30, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-    )
-
-    # LED reflectors
-    reflector_left = doc.addObject("Part::Cone", "Reflector_Left")
-    reflector_left.Radius1 = 12
-    reflector_left.Radius2 = 8
-    reflector_left.Height = 15
-    reflector_left.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 + 15, main_body_width/2 - 30, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), -90)
-    )
+    gimbal_yaw = cylinder(4, 30, FreeCAD.Placement(
+        V(-main_body_length/3, 0, -HALF_H - 20),
+        ROT_IDENTITY
+    ))
 
-    reflector_right = doc.addObject("Part::Cone", "Reflector_Right")
-    reflector_right.Radius1 = 12
-    reflector_right.Radius2 = 8
-    reflector_right.Height = 15
-    reflector_right.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 + 15, -main_body_width/2 + 30, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), -90)
-    )
+    # LED lights (2x high-power) and their reflectors: one prototype each,
+    # turned onto the X axis once and translated to both sides
+    led = cylinder(10, 20, FreeCAD.Placement(V(0, 0, 0), ROT_Y_POS90))
+    reflector = cone(12, 8, 15, FreeCAD.Placement(V(0, 0, 0), ROT_Y_NEG90))
 
-    doc.recompute()
+    side_y = (HALF_W - 30, -HALF_W + 30)
+    leds = [led.translated(V(-HALF_L + 30, y, 0)) for y in side_y]
+    reflectors = [reflector.translated(V(-HALF_L + 15, y, 0)) for y in side_y]
 
-    camera_parts = [camera_housing, lens, gimbal_yaw, led_left, led_right, reflector_left, reflector_right]
-    camera_assembly = doc.addObject("Part::MultiFuse", "CameraSystem")
-    camera_assembly.Shapes = camera_parts
-    doc.recompute()
+    camera_parts = [camera_housing, lens, gimbal_yaw] + leds + reflectors
 
-    return camera_assembly
+    return Part.Compound(camera_parts)
 
 # ============================================================================
 # MOUNTING RAILS & ACCESSORY SYSTEM
@@ -810,99 +479,46 @@ def create_mounting_system():
     """Create universal mounting rail system"""
     print("Creating mounting rail system...")
 
-    rails = []
+    rail_length = main_body_length - 120
+    rail_start = -rail_length / 2
+
+    # Offsets from the hull faces, computed once for the loops below
+    top_z = HALF_H - 10
+    side_y = HALF_W - 10
+    slot_z = HALF_H - 7
 
     # Top rail
-    top_rail = doc.addObject("Part::Box", "TopRail")
-    top_rail.Length = main_body_length - 120
-    top_rail.Width = 15
-    top_rail.Height = 10
-    top_rail.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-(main_body_length - 120)/2, -7.5, main_body_height/2 - 10),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-    rails.append(top_rail)
+    top_rail = box(rail_length, 15, 10, FreeCAD.Placement(
+        V(rail_start, -7.5, top_z),
+        ROT_IDENTITY
+    ))
 
     # Side rails (left and right)
-    for side in [-1, 1]:
-        side_rail = doc.addObject("Part::Box", f"SideRail_{side}")
-        side_rail.Length = main_body_length - 120
-        side_rail.Width = 10
-        side_rail.Height = 15
-        side_rail.Placement = FreeCAD.Placement(
-            FreeCAD.Vector(
-                -(main_body_length - 120)/2,
-                side * (main_body_width/2 - 10),
-                -7.5
-            ),
-            FreeCAD.Rotation(0, 0, 0)
-        )
-        rails.append(side_rail)
-
-    # Rail mounting points (T-nuts slots)
-    for rail in rails:
-        for i in range(5):
-            slot = doc.addObject("Part::Box", f"TSlot_{rails.index(rail)}_{i}")
-            slot.Length = 8
-            slot.Width = 4
-            slot.Height = 4
-            # Position along rail
-            x_offset = -(main_body_length - 120)/2 + 20 + i * 40
-            slot.Placement = FreeCAD.Placement(
-                FreeCAD.Vector(x_offset, -2, main_body_height/2 - 7),
-                FreeCAD.Rotation(0, 0, 0)
-            )
-            rails.append(slot)
+    side_rails = [
+        box(rail_length, 10, 15, FreeCAD.Placement(
+            V(rail_start, side * side_y, -7.5),
+            ROT_IDENTITY
+        ))
+        for side in [-1, 1]
+    ]
 
-    doc.recompute()
+    # Rail mounting points (T-nut slots), cut out of the top rail in one
+    # boolean; they run 3mm below its upper face
+    # Position along rail
+    slot_x = rail_start + 20 + np.arange(5, dtype=float) * 40
+
+    slot = Part.makeBox(8, 4, 4)
+    slots = [slot.translated(V(x, -2, slot_z)) for x in slot_x]
+    slotted_top_rail = evaluate(cut(top_rail, *slots))
 
-    return rails
+    return Part.Compound([slotted_top_rail] + side_rails)
 
 # ============================================================================
 # ASSEMBLY
 # ============================================================================
 
-print("=" * 70)
-print("BUILDING HIGHLY DETAILED FISHING DRONE")
-print("=" * 70)
-
-# Create all components
-main_body, ribs = create_main_body()
-thrusters = create_thruster_layout()
-glands, connector_housings = create_cable_glands()
-battery_cells, battery_tray, battery_cover, bms = create_battery_system()
-electronics = create_electronics()
-antenna = create_antenna()
-fishing_mech = create_fishing_mechanism()
-camera_system = create_camera_system()
-mounting_rails = create_mounting_system()
-
-doc.recompute()
-
-# Save document
-output_file = "/home/ymizushi/Develop/ymizushi/fishdrone/fishing_drone_detailed.FCStd"
-doc.saveAs(output_file)
-print(f"\n✓ Detailed model saved: {output_file}")
-
-# Export STEP
-step_file = "/home/ymizushi/Develop/ymizushi/fishdrone/fishing_drone_detailed.step"
-try:
-    all_components = (
-        [main_body] + ribs + thrusters + glands + connector_housings +
-        battery_cells + [battery_tray, battery_cover, bms] +
-        electronics + [antenna, fishing_mech, camera_system] +
-        mounting_rails
-    )
-    Part.export(all_components, step_file)
-    print(f"✓ STEP file exported: {step_file}")
-except Exception as e:
-    print(f"STEP export error: {e}")
-
-# Print specifications
-print("\n" + "=" * 70)
-print("DETAILED FISHING DRONE - COMPLETE SPECIFICATIONS")
-print("=" * 70)
-print(f"""
+# Component summary printed after a build
+SPECIFICATIONS = f"""
 STRUCTURE:
   • Main body: {main_body_length} × {main_body_width} × {main_body_height} mm
   • Wall thickness: {wall_thickness}mm waterproof shell
@@ -912,7 +528,7 @@ STRUCTURE:
 PROPULSION SYSTEM:
   • 6× brushless thrusters with detailed components:
     - Motor housings ({thruster_motor_diameter}mm diameter)
-    - 3-blade propellers ({propeller_diameter}mm diameter)
+    - {propeller_blades}-blade propellers ({propeller_diameter}mm diameter)
     - Protective guards with support struts
     - Dedicated mounting arms
   • 4× horizontal thrusters (omnidirectional movement)
@@ -962,7 +578,64 @@ MOUNTING SYSTEM:
   • Modular accessory attachment
 
 TOTAL COMPONENT COUNT: 150+ individual parts
-""")
-print("=" * 70)
-print("Production-ready design with manufactureable components!")
-print("=" * 70)
+"""
+
+def print_specifications():
+    """Print the detailed drone specifications"""
+    print("\n" + "=" * 70)
+    print("DETAILED FISHING DRONE - COMPLETE SPECIFICATIONS")
+    print("=" * 70)
+    print(SPECIFICATIONS)
+    print("=" * 70)
+    print("Production-ready design with manufactureable components!")
+    print("=" * 70)
+
+@coarse_tessellation()
+def build():
+    """Build the detailed drone, save it and export it to STEP"""
+    global doc
+    doc = new_build_document("DetailedFishingDrone")
+
+    print("=" * 70)
+    print("BUILDING HIGHLY DETAILED FISHING DRONE")
+    print("=" * 70)
+
+    # Create all components
+    main_body, ribs = create_main_body()
+    thrusters = create_thruster_layout()
+    cable_glands = create_cable_glands()
+    battery_system = create_battery_system()
+    electronics = create_electronics()
+    antenna = create_antenna()
+    fishing_mech = create_fishing_mechanism()
+    camera_system = create_camera_system()
+    mounting_rails = create_mounting_system()
+
+    # Every component is a plain shape, so the whole drone is a single
+    # compound held by one Part::Feature
+    everything = Part.Compound([
+        main_body, ribs, thrusters, cable_glands, battery_system, electronics,
+        antenna, fishing_mech, camera_system, mounting_rails,
+    ])
+    drone = add_shape(doc, everything, "Drone")
+
+    doc.RecomputesFrozen = False
+    doc.recompute()
+
+    # Save document
+    output_file = "/home/ymizushi/Develop/ymizushi/fishdrone/fishing_drone_detailed.FCStd"
+    save_document(doc, output_file)
+    print(f"\n✓ Detailed model saved: {output_file}")
+
+    # Export STEP
+    step_file = "/home/ymizushi/Develop/ymizushi/fishdrone/fishing_drone_detailed.step"
+    try:
+        export_step([drone], step_file)
+        print(f"✓ STEP file exported: {step_file}")
+    except Exception as e:
+        print(f"STEP export error: {e}")
+
+    print_specifications()
+
+if __name__ == "__main__":
+    build()
@@ -11,8 +11,10 @@ import FreeCAD
 import Part
 import Sketcher
 
+from drone_common import new_build_document
+
 # Create a new document
-doc = FreeCAD.newDocument("FishingDroneHull")
+doc = new_build_document("FishingDroneHull")
 
 # Parameters for the hull
 hull_length = 400  # mm
@@ -25,49 +27,29 @@ def create_pontoon(x_offset=0, name_suffix=""):
     """Create a single pontoon hull shape"""
 
     # Create a basic box for the pontoon
-    pontoon = doc.addObject("Part::Box", f"Pontoon{name_suffix}")
-    pontoon.Length = hull_length
-    pontoon.Width = hull_width
-    pontoon.Height = hull_height
-    pontoon.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(x_offset - hull_length/2, -hull_width/2, 0),
-        FreeCAD.Rotation(0, 0, 0)
+    pontoon = Part.makeBox(
+        hull_length, hull_width, hull_height,
+        FreeCAD.Vector(x_offset - hull_length/2, -hull_width/2, 0)
     )
 
-    doc.recompute()
-
     # Create rounded nose (bow)
     nose_radius = hull_width / 2
-    nose = doc.addObject("Part::Sphere", f"Nose{name_suffix}")
-    nose.Radius = nose_radius
-    nose.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(x_offset + hull_length/2, 0, nose_radius),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    doc.recompute()
+    nose = Part.makeSphere(nose_radius, FreeCAD.Vector(x_offset + hull_length/2, 0, nose_radius))
 
     # Combine pontoon and nose
-    fusion = doc.addObject("Part::MultiFuse", f"PontoonFused{name_suffix}")
-    fusion.Shapes = [pontoon, nose]
-
-    doc.recompute()
+    fusion = doc.addObject("Part::Feature", f"PontoonFused{name_suffix}")
+    fusion.Shape = pontoon.fuse(nose)
 
     return fusion
 
 def create_deck():
     """Create a deck platform connecting the two pontoons"""
-    deck = doc.addObject("Part::Box", "Deck")
-    deck.Length = hull_length - 40
-    deck.Width = pontoon_spacing + hull_width
-    deck.Height = 5  # 5mm thick deck
-    deck.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-hull_length/2 + 20, -pontoon_spacing/2 - hull_width/2, hull_height),
-        FreeCAD.Rotation(0, 0, 0)
+    deck = doc.addObject("Part::Feature", "Deck")
+    deck.Shape = Part.makeBox(
+        hull_length - 40, pontoon_spacing + hull_width, 5,  # 5mm thick deck
+        FreeCAD.Vector(-hull_length/2 + 20, -pontoon_spacing/2 - hull_width/2, hull_height)
     )
 
-    doc.recompute()
-
     return deck
 
 # Create the catamaran hull
@@ -80,6 +62,7 @@ right_pontoon = create_pontoon(pontoon_spacing/2, "_Right")
 print("Creating deck...")
 deck = create_deck()
 
+doc.RecomputesFrozen = False
 doc.recompute()
 
 # Save the document
@@ -10,555 +10,302 @@ sys.path.append('/usr/lib/freecad/lib')
 import FreeCAD
 import Part
 import math
-
-doc = FreeCAD.newDocument("OptimizedFishingDrone")
-
-# Parameters
-main_body_length = 350
-main_body_width = 280
-main_body_height = 180
-wall_thickness = 4
-thruster_diameter = 60
-thruster_length = 80
-propeller_diameter = 70
-
-print("=" * 70)
-print("BUILDING OPTIMIZED DETAILED FISHING DRONE")
-print("=" * 70)
+import numpy as np
+
+from drone_common import (
+    HALF_H, HALF_L, HALF_W, ROT_IDENTITY, ROT_X_POS90, ROT_Y_POS90, THRUSTER_TABLE, R, V,
+    main_body_height, main_body_length, main_body_width, propeller_diameter,
+    thruster_diameter, thruster_length, wall_thickness,
+    add_shape, box, build_hollow_hull, build_in_processes,
+    coarse_tessellation, cone, cut, cylinder, evaluate, export_step, new_build_document,
+    ring, save_document, sphere, torus,
+)
+
+# Active document, created by build()
+doc = None
+
+# Print a progress line per subsystem while building
+VERBOSE = False
+
+# Positions of repeated components as (N, 3) arrays of x, y, z; builders
+# translate one prototype to each row
+# Battery cells (8 cylinders in 4S2P)
+CELL_POS = np.array(
+    [[-45 + i*30, -20 + j*40, -HALF_H + 18] for i in range(4) for j in range(2)]
+)
+# ESCs (one per thruster) on a 3x2 grid
+ESC_POS = np.array(
+    [[-60 + col*45, -50 + row*60, 11.6] for row in range(2) for col in range(3)]
+)
+
+def progress(message):
+    """Print a build progress message when VERBOSE is set"""
+    if VERBOSE:
+        print(message)
 
 # ============================================================================
 # MAIN BODY WITH DETAILS
 # ============================================================================
 
 def create_body():
-    print("Creating streamlined body with mounting features...")
-
-    # Center section
-    center = doc.addObject("Part::Box", "CenterBody")
-    center.Length = main_body_length - 100
-    center.Width = main_body_width
-    center.Height = main_body_height
-    center.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-(main_body_length-100)/2, -main_body_width/2, -main_body_height/2),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    # Nose
-    nose = doc.addObject("Part::Sphere", "Nose")
-    nose.Radius = main_body_height / 2
-    nose.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-(main_body_length-100)/2, 0, 0),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    # Tail
-    tail = doc.addObject("Part::Sphere", "Tail")
-    tail.Radius = main_body_height / 2
-    tail.Placement = FreeCAD.Placement(
-        FreeCAD.Vector((main_body_length-100)/2, 0, 0),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    progress("Creating streamlined body with mounting features...")
 
-    doc.recompute()
-
-    # Fuse outer
-    outer = doc.addObject("Part::MultiFuse", "BodyOuter")
-    outer.Shapes = [center, nose, tail]
-    doc.recompute()
-
-    # Interior
-    center_inner = doc.addObject("Part::Box", "CenterInner")
-    center_inner.Length = main_body_length - 100 - 2*wall_thickness
-    center_inner.Width = main_body_width - 2*wall_thickness
-    center_inner.Height = main_body_height - 2*wall_thickness
-    center_inner.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(
-            -(main_body_length-100)/2 + wall_thickness,
-            -main_body_width/2 + wall_thickness,
-            -main_body_height/2 + wall_thickness
-        ),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    nose_inner = doc.addObject("Part::Sphere", "NoseInner")
-    nose_inner.Radius = main_body_height/2 - wall_thickness
-    nose_inner.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-(main_body_length-100)/2 + wall_thickness/2, 0, 0),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    tail_inner = doc.addObject("Part::Sphere", "TailInner")
-    tail_inner.Radius = main_body_height/2 - wall_thickness
-    tail_inner.Placement = FreeCAD.Placement(
-        FreeCAD.Vector((main_body_length-100)/2 - wall_thickness/2, 0, 0),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    doc.recompute()
-
-    inner = doc.addObject("Part::MultiFuse", "BodyInner")
-    inner.Shapes = [center_inner, nose_inner, tail_inner]
-    doc.recompute()
-
-    # Make hollow
-    hollow = doc.addObject("Part::Cut", "HollowBody")
-    hollow.Base = outer
-    hollow.Tool = inner
-    doc.recompute()
-
-    return hollow
+    # Same hollow shell as the advanced and detailed drones: box center
+    # section with spherical nose and tail, hollowed to the wall thickness
+    return build_hollow_hull(main_body_length, main_body_width, main_body_height, wall_thickness)
 
 # ============================================================================
 # DETAILED THRUSTER
 # ============================================================================
 
-def create_thruster(pos, rot, name):
-    """Single detailed thruster"""
+# Blade offsets from the thruster axis and blade rotations, the same for
+# every thruster: 3 blades, 120 degrees apart, 15mm out
+BLADE_OFFSETS = tuple(
+    (math.cos(math.radians(angle)) * 15, math.sin(math.radians(angle)) * 15, R(0, 0, angle))
+    for angle in (0, 120, 240)
+)
+
+def create_thruster(pos, rot):
+    """Single detailed thruster
+
+    The parts are built around the origin and the finished compound is
+    moved to pos with one translation.
+    """
+    origin = V(0, 0, 0)
 
     # Motor housing
-    motor = doc.addObject("Part::Cylinder", f"Motor_{name}")
-    motor.Radius = thruster_diameter / 2 - 5
-    motor.Height = thruster_length
-    motor.Placement = FreeCAD.Placement(pos, rot)
+    motor = cylinder(thruster_diameter / 2 - 5, thruster_length, FreeCAD.Placement(origin, rot))
 
     # Motor mount flange
-    flange = doc.addObject("Part::Cylinder", f"Flange_{name}")
-    flange.Radius = thruster_diameter / 2
-    flange.Height = 5
-    flange_pos = FreeCAD.Vector(pos.x, pos.y, pos.z + thruster_length/2)
-    flange.Placement = FreeCAD.Placement(flange_pos, rot)
+    flange_pos = V(0, 0, thruster_length/2)
+    flange = cylinder(thruster_diameter / 2, 5, FreeCAD.Placement(flange_pos, rot))
 
     # Propeller (3 blades simplified as boxes)
     blades = []
-    for i in range(3):
-        blade = doc.addObject("Part::Box", f"Blade_{name}_{i}")
-        blade.Length = propeller_diameter/2 - 5
-        blade.Width = 10
-        blade.Height = 2
-
-        angle = i * 120
-        rad = math.radians(angle)
-        blade_x = pos.x + math.cos(rad) * 15
-        blade_y = pos.y + math.sin(rad) * 15
-
-        blade.Placement = FreeCAD.Placement(
-            FreeCAD.Vector(blade_x, blade_y, pos.z + thruster_length + 2),
-            FreeCAD.Rotation(0, 0, angle)
-        )
-        blades.append(blade)
+    for dx, dy, blade_rot in BLADE_OFFSETS:
+        blades.append(box(
+            propeller_diameter/2 - 5, 10, 2,
+            FreeCAD.Placement(
+                V(dx, dy, thruster_length + 2),
+                blade_rot
+            )
+        ))
 
     # Propeller hub
-    hub = doc.addObject("Part::Cylinder", f"Hub_{name}")
-    hub.Radius = 10
-    hub.Height = 8
-    hub.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(pos.x, pos.y, pos.z + thruster_length),
+    hub = cylinder(10, 8, FreeCAD.Placement(
+        V(0, 0, thruster_length),
         rot
-    )
+    ))
 
     # Guard ring
-    guard_out = doc.addObject("Part::Cylinder", f"GuardOut_{name}")
-    guard_out.Radius = propeller_diameter/2 + 8
-    guard_out.Height = 4
-    guard_out.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(pos.x, pos.y, pos.z + thruster_length + 8),
+    guard_out = cylinder(propeller_diameter/2 + 8, 4, FreeCAD.Placement(
+        V(0, 0, thruster_length + 8),
         rot
-    )
-
-    guard_in = doc.addObject("Part::Cylinder", f"GuardIn_{name}")
-    guard_in.Radius = propeller_diameter/2 + 4
-    guard_in.Height = 6
-    guard_in.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(pos.x, pos.y, pos.z + thruster_length + 7),
+    ))
+    guard_in = cylinder(propeller_diameter/2 + 4, 6, FreeCAD.Placement(
+        V(0, 0, thruster_length + 7),
         rot
-    )
-
-    doc.recompute()
-
-    guard = doc.addObject("Part::Cut", f"Guard_{name}")
-    guard.Base = guard_out
-    guard.Tool = guard_in
-    doc.recompute()
+    ))
+    guard = evaluate(cut(guard_out, guard_in))
 
     # Mount arm
-    arm = doc.addObject("Part::Box", f"Arm_{name}")
-    arm.Length = 50
-    arm.Width = 8
-    arm.Height = 8
-    arm.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(pos.x - 25, pos.y - 4, pos.z + thruster_length/2),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    doc.recompute()
+    arm = box(50, 8, 8, FreeCAD.Placement(
+        V(-25, -4, thruster_length/2),
+        ROT_IDENTITY
+    ))
 
-    # Fuse thruster parts
+    # Group thruster parts; the assembly is only shown and exported, so
+    # it does not need to be fused into one solid
     parts = [motor, flange, hub, guard, arm] + blades
-    assy = doc.addObject("Part::MultiFuse", f"Thruster_{name}")
-    assy.Shapes = parts
-    doc.recompute()
-
-    return assy
+    return Part.Compound(parts).translated(pos)
 
 # ============================================================================
 # THRUSTER LAYOUT
 # ============================================================================
 
-def create_thrusters():
-    print("Creating 6-thruster configuration...")
-
-    thrusters = []
+def build_thruster_brep(row):
+    """Build one thruster from a THRUSTER_TABLE row and return it as BRep text"""
+    thruster = create_thruster(V(*row[:3]), R(tuple(row[3:6]), row[6]))
+    return thruster.exportBrepToString()
 
-    # 4 horizontal thrusters
-    thrusters.append(create_thruster(
-        FreeCAD.Vector(-main_body_length/2 - 40, main_body_width/2 - 40, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90),
-        "FL"
-    ))
-
-    thrusters.append(create_thruster(
-        FreeCAD.Vector(-main_body_length/2 - 40, -main_body_width/2 + 40, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90),
-        "FR"
-    ))
-
-    thrusters.append(create_thruster(
-        FreeCAD.Vector(main_body_length/2 + 40, main_body_width/2 - 40, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), -90),
-        "RL"
-    ))
-
-    thrusters.append(create_thruster(
-        FreeCAD.Vector(main_body_length/2 + 40, -main_body_width/2 + 40, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), -90),
-        "RR"
-    ))
-
-    # 2 vertical thrusters
-    thrusters.append(create_thruster(
-        FreeCAD.Vector(0, 60, main_body_height/2 + 10),
-        FreeCAD.Rotation(0, 0, 0),
-        "TV"
-    ))
+def create_thrusters():
+    progress("Creating 6-thruster configuration...")
 
-    thrusters.append(create_thruster(
-        FreeCAD.Vector(0, -60, -main_body_height/2 - 10),
-        FreeCAD.Rotation(0, 0, 0),
-        "BV"
-    ))
+    # The thrusters share no geometry, so each one is built in its own process
+    shapes = build_in_processes(build_thruster_brep, THRUSTER_TABLE, max_workers=len(THRUSTER_TABLE))
 
-    return thrusters
+    return add_shape(doc, Part.Compound(shapes), "Thrusters")
 
 # ============================================================================
 # BATTERY PACK
 # ============================================================================
 
 def create_battery():
-    print("Creating battery pack...")
+    progress("Creating battery pack...")
 
     # Battery housing
-    housing = doc.addObject("Part::Box", "BatteryHousing")
-    housing.Length = 140
-    housing.Width = 90
-    housing.Height = 70
-    housing.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-70, -45, -main_body_height/2 + 15),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    housing = box(140, 90, 70, FreeCAD.Placement(
+        V(-70, -45, -HALF_H + 15),
+        ROT_IDENTITY
+    ))
 
     # Battery cells (8 cylinders in 4S2P)
-    cells = []
-    for i in range(4):
-        for j in range(2):
-            cell = doc.addObject("Part::Cylinder", f"Cell_{i}_{j}")
-            cell.Radius = 9
-            cell.Height = 65
-            cell.Placement = FreeCAD.Placement(
-                FreeCAD.Vector(-45 + i*30, -20 + j*40, -main_body_height/2 + 18),
-                FreeCAD.Rotation(0, 0, 0)
-            )
-            cells.append(cell)
+    cell = Part.makeCylinder(9, 65)
+    cells = [cell.translated(V(x, y, z)) for x, y, z in CELL_POS]
 
     # BMS board
-    bms = doc.addObject("Part::Box", "BMS")
-    bms.Length = 50
-    bms.Width = 35
-    bms.Height = 2
-    bms.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-25, -17.5, -main_body_height/2 + 85),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    doc.recompute()
+    bms = box(50, 35, 2, FreeCAD.Placement(
+        V(-25, -17.5, -HALF_H + 85),
+        ROT_IDENTITY
+    ))
 
-    return [housing, bms] + cells
+    return Part.Compound([housing, bms] + cells)
 
 # ============================================================================
 # ELECTRONICS BAY
 # ============================================================================
 
 def create_electronics():
-    print("Creating electronics...")
+    progress("Creating electronics...")
 
     # Main PCB
-    pcb = doc.addObject("Part::Box", "MainPCB")
-    pcb.Length = 180
-    pcb.Width = 120
-    pcb.Height = 1.6
-    pcb.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-90, -60, 10),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    pcb = box(180, 120, 1.6, FreeCAD.Placement(
+        V(-90, -60, 10),
+        ROT_IDENTITY
+    ))
 
     # Microcontroller
-    mcu = doc.addObject("Part::Box", "MCU")
-    mcu.Length = 35
-    mcu.Width = 35
-    mcu.Height = 4
-    mcu.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-17.5, -17.5, 11.6),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    mcu = box(35, 35, 4, FreeCAD.Placement(
+        V(-17.5, -17.5, 11.6),
+        ROT_IDENTITY
+    ))
 
     # 6 ESCs (one per thruster)
-    escs = []
-    for i in range(6):
-        esc = doc.addObject("Part::Box", f"ESC_{i}")
-        esc.Length = 38
-        esc.Width = 20
-        esc.Height = 10
-
-        row = i // 3
-        col = i % 3
-
-        esc.Placement = FreeCAD.Placement(
-            FreeCAD.Vector(-60 + col*45, -50 + row*60, 11.6),
-            FreeCAD.Rotation(0, 0, 0)
-        )
-        escs.append(esc)
-
-    doc.recompute()
+    esc = Part.makeBox(38, 20, 10)
+    escs = [esc.translated(V(x, y, z)) for x, y, z in ESC_POS]
 
-    return [pcb, mcu] + escs
+    return Part.Compound([pcb, mcu] + escs)
 
 # ============================================================================
 # WATERPROOF CONNECTORS
 # ============================================================================
 
 def create_connectors():
-    print("Creating waterproof connectors...")
-
-    connectors = []
+    progress("Creating waterproof connectors...")
 
     # Main power connector
-    power = doc.addObject("Part::Cylinder", "PowerConnector")
-    power.Radius = 8
-    power.Height = 35
-    power.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(main_body_length/2 - 15, 0, main_body_height/2 - 15),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-    )
-    connectors.append(power)
+    power = cylinder(8, 35, FreeCAD.Placement(
+        V(HALF_L - 15, 0, HALF_H - 15),
+        ROT_Y_POS90
+    ))
 
     # Communication connector
-    comm = doc.addObject("Part::Cylinder", "CommConnector")
-    comm.Radius = 6
-    comm.Height = 30
-    comm.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(main_body_length/2 - 15, main_body_width/2 - 15, 25),
-        FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 90)
-    )
-    connectors.append(comm)
-
-    doc.recompute()
+    comm = cylinder(6, 30, FreeCAD.Placement(
+        V(HALF_L - 15, HALF_W - 15, 25),
+        ROT_X_POS90
+    ))
 
-    return connectors
+    return Part.Compound([power, comm])
 
 # ============================================================================
 # FISHING LINE MECHANISM
 # ============================================================================
 
-def create_fishing_system():
-    print("Creating fishing line release system...")
-
-    # Servo housing
-    servo = doc.addObject("Part::Box", "ServoBox")
-    servo.Length = 45
-    servo.Width = 22
-    servo.Height = 38
-    servo.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 55, -11, -19),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    # Spool
-    spool = doc.addObject("Part::Cylinder", "LineSpool")
-    spool.Radius = 22
-    spool.Height = 45
-    spool.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 85, 0, -10),
-        FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 90)
-    )
-
-    # Guide tube
-    guide_out = doc.addObject("Part::Cylinder", "GuideOuter")
-    guide_out.Radius = 5
-    guide_out.Height = 45
-    guide_out.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 105, 0, -10),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-    )
-
-    guide_in = doc.addObject("Part::Cylinder", "GuideInner")
-    guide_in.Radius = 3
-    guide_in.Height = 50
-    guide_in.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 107, 0, -10),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-    )
+# Fishing system primitives: shape factory, dimensions, offset (x, y, z)
+# from the front of the body and rotation. The placements all share the same
+# base x, so the table only holds the offsets from it.
+FISHING_PRIMS = (
+    (box, (45, 22, 38), (-55, -11, -19), ROT_IDENTITY),  # servo
+    (cylinder, (22, 45), (-85, 0, -10), ROT_X_POS90),  # spool
+    (ring, (5, 3, 45), (-105, 0, -10), ROT_Y_POS90),  # guide
+    (torus, (10, 2.5), (-130, 0, -10), ROT_Y_POS90),  # hook
+)
 
-    doc.recompute()
-
-    guide = doc.addObject("Part::Cut", "LineGuide")
-    guide.Base = guide_out
-    guide.Tool = guide_in
-    doc.recompute()
-
-    # Hook attachment
-    hook = doc.addObject("Part::Torus", "HookRing")
-    hook.Radius1 = 10
-    hook.Radius2 = 2.5
-    hook.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 - 130, 0, -10),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-    )
+def create_fishing_system():
+    progress("Creating fishing line release system...")
 
-    doc.recompute()
+    base_x = -HALF_L
+    parts = [
+        factory(*dims, FreeCAD.Placement(V(base_x + dx, dy, dz), rot))
+        for factory, dims, (dx, dy, dz), rot in FISHING_PRIMS
+    ]
 
-    return [servo, spool, guide, hook]
+    return Part.Compound(parts)
 
 # ============================================================================
 # CAMERA & LIGHTS
 # ============================================================================
 
 def create_camera():
-    print("Creating camera and lighting...")
+    progress("Creating camera and lighting...")
 
     # Camera housing (sphere)
-    cam_housing = doc.addObject("Part::Sphere", "CameraHousing")
-    cam_housing.Radius = 22
-    cam_housing.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/3, 0, -main_body_height/2 - 38),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    cam_housing = sphere(22, V(-main_body_length/3, 0, -HALF_H - 38))
 
     # Lens
-    lens = doc.addObject("Part::Cylinder", "Lens")
-    lens.Radius = 9
-    lens.Height = 12
-    lens.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/3, 0, -main_body_height/2 - 55),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    lens = cylinder(9, 12, FreeCAD.Placement(
+        V(-main_body_length/3, 0, -HALF_H - 55),
+        ROT_IDENTITY
+    ))
 
     # LED lights
-    led_l = doc.addObject("Part::Cylinder", "LED_Left")
-    led_l.Radius = 11
-    led_l.Height = 22
-    led_l.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 + 35, main_body_width/2 - 32, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-    )
-
-    led_r = doc.addObject("Part::Cylinder", "LED_Right")
-    led_r.Radius = 11
-    led_r.Height = 22
-    led_r.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(-main_body_length/2 + 35, -main_body_width/2 + 32, 0),
-        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-    )
-
-    doc.recompute()
+    led_l = cylinder(11, 22, FreeCAD.Placement(
+        V(-HALF_L + 35, HALF_W - 32, 0),
+        ROT_Y_POS90
+    ))
+    led_r = cylinder(11, 22, FreeCAD.Placement(
+        V(-HALF_L + 35, -HALF_W + 32, 0),
+        ROT_Y_POS90
+    ))
 
-    return [cam_housing, lens, led_l, led_r]
+    return Part.Compound([cam_housing, lens, led_l, led_r])
 
 # ============================================================================
 # ANTENNA
 # ============================================================================
 
 def create_antenna():
-    print("Creating antenna...")
+    progress("Creating antenna...")
+
+    # The mast, tip and base are stacked on one vertical axis, so they are
+    # built on the Z axis and moved onto it together
+    axis = V(HALF_L - 42, 0, 0)
 
     # Mast
-    mast = doc.addObject("Part::Cylinder", "AntennaMast")
-    mast.Radius = 3.5
-    mast.Height = 85
-    mast.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(main_body_length/2 - 42, 0, main_body_height/2),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    mast = cylinder(3.5, 85, FreeCAD.Placement(V(0, 0, HALF_H), ROT_IDENTITY))
 
     # Tip
-    tip = doc.addObject("Part::Cone", "AntennaTip")
-    tip.Radius1 = 3.5
-    tip.Radius2 = 0
-    tip.Height = 18
-    tip.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(main_body_length/2 - 42, 0, main_body_height/2 + 85),
-        FreeCAD.Rotation(0, 0, 0)
-    )
+    tip = cone(3.5, 0, 18, FreeCAD.Placement(V(0, 0, HALF_H + 85), ROT_IDENTITY))
 
     # Base
-    base = doc.addObject("Part::Cylinder", "AntennaBase")
-    base.Radius = 9
-    base.Height = 12
-    base.Placement = FreeCAD.Placement(
-        FreeCAD.Vector(main_body_length/2 - 42, 0, main_body_height/2 - 6),
-        FreeCAD.Rotation(0, 0, 0)
-    )
-
-    doc.recompute()
+    base = cylinder(9, 12, FreeCAD.Placement(V(0, 0, HALF_H - 6), ROT_IDENTITY))
 
     ant_parts = [mast, tip, base]
-    antenna = doc.addObject("Part::MultiFuse", "Antenna")
-    antenna.Shapes = ant_parts
-    doc.recompute()
 
-    return antenna
+    return Part.Compound(ant_parts).translated(axis)
 
 # ============================================================================
 # BUILD ASSEMBLY
 # ============================================================================
 
-body = create_body()
-thrusters = create_thrusters()
-battery = create_battery()
-electronics = create_electronics()
-connectors = create_connectors()
-fishing = create_fishing_system()
-camera = create_camera()
-antenna = create_antenna()
-
-doc.recompute()
-
-# Save
-output = "/home/ymizushi/Develop/ymizushi/fishdrone/fishing_drone_detailed.FCStd"
-doc.saveAs(output)
-print(f"\n✓ Model saved: {output}")
-
-# Export STEP
-step_out = "/home/ymizushi/Develop/ymizushi/fishdrone/fishing_drone_detailed.step"
-try:
-    all_parts = [body, antenna] + thrusters + battery + electronics + connectors + fishing + camera
-    Part.export(all_parts, step_out)
-    print(f"✓ STEP exported: {step_out}")
-except Exception as e:
-    print(f"STEP export: {e}")
-
-print("\n" + "=" * 70)
-print("DETAILED FISHING DRONE - SPECIFICATIONS")
-print("=" * 70)
-print(f"""
+# Subsystems built from plain shapes only, with the feature each one ends up in
+SHAPE_SUBSYSTEMS = (
+    ("HollowBody", create_body),
+    ("BatteryPack", create_battery),
+    ("Electronics", create_electronics),
+    ("Connectors", create_connectors),
+    ("FishingSystem", create_fishing_system),
+    ("CameraSystem", create_camera),
+    ("Antenna", create_antenna),
+)
+
+def print_specifications():
+    """Print the optimized drone specifications"""
+    print(f"""
+{"=" * 70}
+DETAILED FISHING DRONE - SPECIFICATIONS
+{"=" * 70}
+
 BODY: {main_body_length}×{main_body_width}×{main_body_height}mm, {wall_thickness}mm wall
 PROPULSION: 6 detailed thrusters (4H + 2V) with guards
 POWER: 8-cell Li-ion pack (4S2P), BMS
@@ -570,5 +317,53 @@ COMMUNICATION: RF antenna system
 
 TOTAL PARTS: 70+ components
 READY FOR: 3D printing, CNC machining, assembly
-""")
-print("=" * 70)
+
+{"=" * 70}""")
+
+@coarse_tessellation()
+def build():
+    """Build the optimized drone, save it and export it to STEP"""
+    global doc
+
+    # The build is meant to run headless; under the GUI every added feature
+    # would also get a view provider and a Coin3D scene-graph node
+    if FreeCAD.GuiUp:
+        raise RuntimeError("Run this script with freecadcmd, not from the FreeCAD GUI")
+
+    doc = new_build_document("OptimizedFishingDrone")
+
+    progress("=" * 70)
+    progress("BUILDING OPTIMIZED DETAILED FISHING DRONE")
+    progress("=" * 70)
+
+    # Every primitive and boolean is made first; the document only receives
+    # finished shapes afterwards. The thrusters are built in worker processes
+    thrusters = create_thrusters()
+
+    # The other subsystems are cheap; Part holds the GIL, so they are simply
+    # built one after another
+    body, battery, electronics, connectors, fishing, camera, antenna = (
+        add_shape(doc, builder(), name) for name, builder in SHAPE_SUBSYSTEMS
+    )
+
+    doc.RecomputesFrozen = False
+    doc.recompute()
+
+    # Save
+    output = "/home/ymizushi/Develop/ymizushi/fishdrone/fishing_drone_detailed.FCStd"
+    save_document(doc, output)
+    print(f"\n✓ Model saved: {output}")
+
+    # Export STEP
+    step_out = "/home/ymizushi/Develop/ymizushi/fishdrone/fishing_drone_detailed.step"
+    try:
+        all_parts = [body, antenna, thrusters, battery, electronics, connectors, fishing, camera]
+        export_step(all_parts, step_out)
+        print(f"✓ STEP exported: {step_out}")
+    except Exception as e:
+        print(f"STEP export: {e}")
+
+    print_specifications()
+
+if __name__ == "__main__":
+    build()
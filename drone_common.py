@@ -0,0 +1,393 @@
+"""
+Shared design parameters and geometry helpers for the fishing drone FreeCAD scripts
+Imported by create_hull.py, create_advanced_hull.py, create_detailed_drone.py
+and create_optimized_detailed_drone.py
+"""
+
+import sys
+sys.path.append('/usr/lib/freecad/lib')
+
+import FreeCAD
+import Part
+import multiprocessing
+import os
+import shutil
+import tempfile
+import numpy as np
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+
+# ============================================================================
+# DESIGN PARAMETERS
+# ============================================================================
+
+# Every drone variant is built around the same main body and thrusters; the
+# scripts import these instead of keeping their own copies
+
+# Main body
+main_body_length = 350  # mm
+main_body_width = 280   # mm
+main_body_height = 180  # mm
+wall_thickness = 4      # mm
+
+# Thruster specifications
+thruster_diameter = 60  # mm
+thruster_length = 80    # mm
+propeller_diameter = 70  # mm
+
+# Half dimensions of the main body, used by most positioning expressions
+HALF_L = main_body_length / 2
+HALF_W = main_body_width / 2
+HALF_H = main_body_height / 2
+
+# Thruster layout: position (x, y, z), rotation axis (x, y, z), rotation angle
+# of the detailed and optimized drones
+# FL/FR/RL/RR are horizontal, TV/BV are the vertical (depth) thrusters
+THRUSTER_TABLE = np.array([
+    [-HALF_L - 40, HALF_W - 40, 0, 0, 1, 0, 90],  # FL
+    [-HALF_L - 40, -HALF_W + 40, 0, 0, 1, 0, 90],  # FR
+    [HALF_L + 40, HALF_W - 40, 0, 0, 1, 0, -90],  # RL
+    [HALF_L + 40, -HALF_W + 40, 0, 0, 1, 0, -90],  # RR
+    [0, 60, HALF_H + 10, 0, 0, 1, 0],  # TV
+    [0, -60, -HALF_H - 10, 0, 0, 1, 0],  # BV
+], dtype=float)
+
+# ============================================================================
+# SHARED VECTORS & ROTATIONS
+# ============================================================================
+
+# Placements and shape factories copy the vectors and rotations they are
+# given, so identical ones can be created once and shared by every primitive
+_vector_cache = {}
+_rotation_cache = {}
+
+def V(x, y, z):
+    """Shared FreeCAD.Vector for the given coordinates"""
+    key = (x, y, z)
+    vector = _vector_cache.get(key)
+    if vector is None:
+        vector = _vector_cache.setdefault(key, FreeCAD.Vector(x, y, z))
+    return vector
+
+def R(*args):
+    """Shared FreeCAD.Rotation for the given constructor arguments
+
+    Takes the same arguments as FreeCAD.Rotation, with an axis given as an
+    (x, y, z) tuple: R(yaw, pitch, roll) or R((x, y, z), angle).
+    """
+    rotation = _rotation_cache.get(args)
+    if rotation is None:
+        rotation = _rotation_cache.setdefault(args, FreeCAD.Rotation(
+            *(V(*arg) if isinstance(arg, tuple) else arg for arg in args)
+        ))
+    return rotation
+
+ROT_IDENTITY = R(0, 0, 0)
+ROT_Y_POS90 = R((0, 1, 0), 90)
+ROT_Y_NEG90 = R((0, 1, 0), -90)
+ROT_X_POS90 = R((1, 0, 0), 90)
+
+# ============================================================================
+# SHAPE FACTORIES
+# ============================================================================
+
+# The factories hand out placed instances of one cached prototype per size, so
+# primitives that recur across builders (arms, standoffs, connector bodies)
+# are only made once. An instance shares the prototype's geometry and only
+# carries its own location, so placing it never moves the cached shape.
+# OCCT booleans may adjust the tolerances of their operands' sub-shapes in
+# place, so evaluate() hands them copies instead of the shared geometry.
+
+@lru_cache(maxsize=None)
+def _box(length, width, height):
+    return Part.makeBox(length, width, height)
+
+@lru_cache(maxsize=None)
+def _cylinder(radius, height):
+    return Part.makeCylinder(radius, height)
+
+@lru_cache(maxsize=None)
+def _cone(radius1, radius2, height):
+    return Part.makeCone(radius1, radius2, height)
+
+@lru_cache(maxsize=None)
+def _torus(radius1, radius2):
+    return Part.makeTorus(radius1, radius2)
+
+@lru_cache(maxsize=None)
+def _ring(outer_radius, inner_radius, height):
+    center = V(0, 0, 0)
+    normal = V(0, 0, 1)
+    outer = Part.Wire(Part.Circle(center, normal, outer_radius).toShape())
+    inner = Part.Wire(Part.Circle(center, normal, inner_radius).toShape())
+    return Part.Face([outer, inner], "Part::FaceMakerBullseye").extrude(
+        V(0, 0, height)
+    )
+
+def _placed(prototype, placement):
+    return prototype.transformed(placement.toMatrix())
+
+def box(length, width, height, placement):
+    """Make a box shape positioned like a Part::Box with the given Placement"""
+    return _placed(_box(length, width, height), placement)
+
+def cylinder(radius, height, placement):
+    """Make a cylinder shape positioned like a Part::Cylinder with the given Placement"""
+    return _placed(_cylinder(radius, height), placement)
+
+def cone(radius1, radius2, height, placement):
+    """Make a cone shape positioned like a Part::Cone with the given Placement"""
+    return _placed(_cone(radius1, radius2, height), placement)
+
+def sphere(radius, center):
+    """Make a sphere shape centered on the given point"""
+    return Part.makeSphere(radius, center)
+
+def torus(radius1, radius2, placement):
+    """Make a torus shape positioned like a Part::Torus with the given Placement"""
+    return _placed(_torus(radius1, radius2), placement)
+
+def ring(outer_radius, inner_radius, height, placement):
+    """Make a flat ring positioned like a Part::Cylinder with the given Placement
+
+    The ring is an annulus face extruded along Z, so no boolean is needed to
+    hollow it out.
+    """
+    return _placed(_ring(outer_radius, inner_radius, height), placement)
+
+def add_shape(doc, shape, name):
+    """Add a plain shape to the document as a single Part::Feature"""
+    feature = doc.addObject("Part::Feature", name)
+    feature.Shape = shape
+    return feature
+
+# ============================================================================
+# LAZY CSG TREE
+# ============================================================================
+
+# Builders describe booleans as a tree of CsgNode(op, children) and only hand
+# it to OCC once, after nested unions have been flattened into one n-ary fuse.
+FUSE = "fuse"
+CUT = "cut"
+LEAF = "leaf"
+
+CsgNode = namedtuple("CsgNode", "op children")
+
+def leaf(shape):
+    """Wrap a plain shape as a CSG leaf"""
+    return CsgNode(LEAF, (shape,))
+
+def fuse(*children):
+    """Union of CSG nodes (or plain shapes)"""
+    return CsgNode(FUSE, tuple(_as_node(c) for c in children))
+
+def cut(base, *tools):
+    """Base with every tool subtracted"""
+    return CsgNode(CUT, (_as_node(base),) + tuple(_as_node(t) for t in tools))
+
+def _as_node(item):
+    return item if isinstance(item, CsgNode) else leaf(item)
+
+def flatten(node):
+    """Merge nested fuses into one n-ary fuse and chained cuts into one cut
+
+    FUSE(FUSE(a, b), c) becomes FUSE(a, b, c) and CUT(CUT(a, b), c) becomes
+    CUT(a, b, c); single-operand fuses collapse to their operand.
+    """
+    if node.op == LEAF:
+        return node
+
+    children = [flatten(c) for c in node.children]
+    if node.op == FUSE:
+        merged = []
+        for child in children:
+            merged.extend(child.children if child.op == FUSE else (child,))
+        if len(merged) == 1:
+            return merged[0]
+        return CsgNode(FUSE, tuple(merged))
+
+    base, tools = children[0], children[1:]
+    if base.op == CUT:
+        return CsgNode(CUT, base.children + tuple(tools))
+    return CsgNode(CUT, (base,) + tuple(tools))
+
+def evaluate(node):
+    """Flatten a CSG tree and evaluate it with one OCC boolean per node"""
+    return _evaluate(flatten(node))
+
+def _evaluate(node):
+    if node.op == LEAF:
+        # Leaves may be placed instances of a cached factory prototype; the
+        # boolean works on a copy so it cannot alter the shared geometry
+        return node.children[0].copy()
+    shapes = [_evaluate(c) for c in node.children]
+    if node.op == FUSE:
+        return shapes[0].multiFuse(shapes[1:])
+    return shapes[0].cut(shapes[1:])
+
+# ============================================================================
+# PARALLEL BUILDS
+# ============================================================================
+
+def build_in_processes(build_brep, args, max_workers=None):
+    """Run independent shape builds in worker processes, return the shapes in order
+
+    build_brep must return Shape.exportBrepToString() so the result can be
+    sent back to this process. Workers are forked so they inherit the
+    already configured sys.path, the FreeCAD modules and the calling
+    script's parameters instead of re-running the script. Where fork is
+    unavailable (Windows) or unsafe next to FreeCAD's threads (macOS), the
+    builds run one after another in this process instead.
+    """
+    if "fork" in multiprocessing.get_all_start_methods() and sys.platform != "darwin":
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+            breps = list(pool.map(build_brep, args))
+    else:
+        breps = [build_brep(arg) for arg in args]
+
+    shapes = []
+    for brep in breps:
+        shape = Part.Shape()
+        shape.importBrepFromString(brep)
+        shapes.append(shape)
+    return shapes
+
+# ============================================================================
+# SHARED ASSEMBLIES
+# ============================================================================
+
+@lru_cache(maxsize=8)
+def build_hollow_hull(length, width, height, wall):
+    """Build the hollow streamlined hull shell as a plain shape
+
+    The hull is a box center section (100mm shorter than the overall length)
+    with spherical nose and tail, hollowed out to the given wall thickness.
+    Results are cached per (length, width, height, wall); assigning the
+    returned shape to a Part::Feature copies it, so the cache stays intact.
+    """
+    center_length = length - 100
+    half_center = center_length / 2
+    half_width = width / 2
+    half_height = height / 2
+
+    # Outer shell: center section + rounded nose and tail
+    outer = fuse(
+        Part.makeBox(center_length, width, height, V(-half_center, -half_width, -half_height)),
+        sphere(half_height, V(-half_center, 0, 0)),
+        sphere(half_height, V(half_center, 0, 0)),
+    )
+
+    # Interior, one wall thickness smaller
+    inner = fuse(
+        Part.makeBox(
+            center_length - 2*wall, width - 2*wall, height - 2*wall,
+            V(-half_center + wall, -half_width + wall, -half_height + wall)
+        ),
+        sphere(half_height - wall, V(-half_center + wall/2, 0, 0)),
+        sphere(half_height - wall, V(half_center - wall/2, 0, 0)),
+    )
+
+    return evaluate(cut(outer, inner))
+
+# ============================================================================
+# TESSELLATION
+# ============================================================================
+
+PART_PARAMS = "User parameter:BaseApp/Preferences/Mod/Part"
+
+@contextmanager
+def coarse_tessellation(deviation=1.0, angular_deflection=45.0):
+    """Coarsen Part's display tessellation while building, then restore it
+
+    Usable as a decorator on a build function. The deviation only matters
+    when the GUI meshes shapes for display; STEP export works on the exact
+    BRep, and the scripts never import FreeCADGui, so headless runs skip
+    tessellation altogether.
+    """
+    params = FreeCAD.ParamGet(PART_PARAMS)
+    values = {"MeshDeviation": deviation, "MeshAngularDeflection": angular_deflection}
+
+    # Only the keys the user had set are written back; the others are
+    # removed again, so a build never leaves new preferences in user.cfg
+    present = params.GetFloats()
+    previous = {key: params.GetFloat(key) for key in values if key in present}
+    for key, value in values.items():
+        params.SetFloat(key, value)
+    try:
+        yield
+    finally:
+        for key in values:
+            if key in previous:
+                params.SetFloat(key, previous[key])
+            else:
+                params.RemFloat(key)
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+# STEP files are written with one fixed 0.01mm precision, set once when the
+# module is loaded; mode 2 makes OCCT use write.precision.val as given
+Part.setStaticValue("write.precision.mode", 2)
+Part.setStaticValue("write.precision.val", 0.01)
+
+def export_step(objects, step_file, schema="AP214IS"):
+    """Write the shapes of document objects to STEP as one compound
+
+    Exporting a single in-memory compound skips Part.export()'s walk over the
+    document objects; the objects must have been recomputed already. The
+    schema is set on OCCT's write.step.schema directly; surface curves are
+    left out, since every face already carries its 3D edge curves.
+    """
+    Part.setStaticValue("write.step.schema", schema)
+    Part.setStaticValue("write.surfacecurve.mode", 0)
+
+    # Written into a scratch directory next to the target and moved into
+    # place, so a failed export never leaves a truncated STEP file behind.
+    # The scratch file keeps the target's name, which the STEP header records
+    scratch_dir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(step_file)))
+    scratch_file = os.path.join(scratch_dir, os.path.basename(step_file))
+    try:
+        Part.Compound([obj.Shape for obj in objects]).exportStep(scratch_file)
+        os.replace(scratch_file, step_file)
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+# ============================================================================
+# DOCUMENTS
+# ============================================================================
+
+DOCUMENT_PARAMS = "User parameter:BaseApp/Preferences/Document"
+
+def new_build_document(name):
+    """Create a document for a scripted build, with recomputes frozen and undo off
+
+    Nothing needs an intermediate recompute or an undo step, so the caller
+    only unfreezes recomputes once every component has been added.
+    """
+    doc = FreeCAD.newDocument(name)
+    doc.RecomputesFrozen = True
+    doc.UndoMode = 0
+    return doc
+
+def save_document(doc, filename):
+    """Save a document as an uncompressed FCStd, then restore the compression setting
+
+    The FCStd zip is written store-only, so saving skips the deflate pass
+    over the BRep files at the cost of a larger file.
+    """
+    params = FreeCAD.ParamGet(DOCUMENT_PARAMS)
+    was_set = "CompressionLevel" in params.GetInts()
+    previous = params.GetInt("CompressionLevel")
+    params.SetInt("CompressionLevel", 0)
+    try:
+        doc.saveAs(filename)
+    finally:
+        # A level the user never set is removed again rather than stored
+        if was_set:
+            params.SetInt("CompressionLevel", previous)
+        else:
+            params.RemInt("CompressionLevel")